@@ -1,7 +1,7 @@
 from typing import NoReturn
 
 from lewicki.actors import MessageActor, MessageActorSystem
-from lewicki.messages import Message
+from lewicki.messages import BroadcastMessage, Message
 
 
 class SimpleActorSystem(MessageActorSystem):
@@ -25,11 +25,9 @@ class SimpleActor(MessageActor):
         self.count = 0
 
     def on_next(self, msg: Message) -> NoReturn:
-        print(msg)
-        for name, actor in self.outbox.items():
-            msg = Message(msg.data, sender=self.name, receiver=name,
-                          prev_id=msg.id)
-            self.send(msg)
+        print(repr(msg))
+        self.send(BroadcastMessage(msg.data, self.outbox, sender=self.name,
+                                   prev_id=msg.id))
         self.count += 1
 
     def should_stop(self) -> bool:
@@ -39,5 +37,5 @@ class SimpleActor(MessageActor):
 if __name__ == '__main__':
     actors = [SimpleActor(name=f'a{a}') for a in range(4)]
     system = SimpleActorSystem(name='sys')
-    system.connect(*actors)
+    system.connect(*actors, complete=True)
     system.run()
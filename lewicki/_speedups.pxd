@@ -0,0 +1,7 @@
+cdef class Message:
+    cdef public object data
+    cdef public object receiver
+    cdef public object sender
+    cdef public object kind
+    cdef public object prev_id
+    cdef public object _id
@@ -0,0 +1,117 @@
+# cython: language_level=3
+"""C implementation of the Message class.
+
+Compiled only when setup.py runs with LEWICKI_ENABLE_SPEEDUPS set;
+lewicki.messages transparently falls back to its pure-Python Message
+when this extension is not built. Keep the two in behavioural lockstep.
+
+Hot-path modules compiled with Cython can `cimport` Message from the
+accompanying .pxd to read fields with C struct access.
+"""
+
+import itertools
+import os
+
+from lewicki.messages import MessageKind
+
+_id_counter = itertools.count().__next__
+
+
+def _refresh_id_base():
+    global _ID_BASE
+    _ID_BASE = (os.getpid() << 32) | int.from_bytes(os.urandom(4), 'little')
+
+
+_refresh_id_base()
+os.register_at_fork(after_in_child=_refresh_id_base)
+
+# Interned small-int default; see lewicki.messages._DEFAULT_KIND
+_DEFAULT_KIND = int(MessageKind.DEFAULT)
+
+_MESSAGE_POOL = []
+_MAX_POOL_SIZE = 1024
+
+
+cdef class Message:
+
+    def __init__(
+            self,
+            data,
+            receiver,
+            sender=None,
+            kind=_DEFAULT_KIND,
+            prev_id=None):
+        self.data = data
+        self.receiver = receiver
+        self.sender = sender
+        self.kind = kind
+        self._id = None
+        self.prev_id = prev_id
+
+    @property
+    def id(self):
+        """The message's unique id, minted on first access."""
+        id = self._id
+        if id is None:
+            id = self._id = _ID_BASE ^ _id_counter()
+        return id
+
+    @property
+    def route(self):
+        """A hashable (sender, receiver, kind) key for route caching."""
+        return (self.sender, self.receiver, self.kind)
+
+    @classmethod
+    def acquire(
+            cls,
+            data,
+            receiver,
+            sender=None,
+            kind=_DEFAULT_KIND,
+            prev_id=None):
+        """Returns a recycled Message from the free list, or a new one."""
+        pool = _MESSAGE_POOL
+        if pool:
+            msg = pool.pop()
+            msg.data = data
+            msg.receiver = receiver
+            msg.sender = sender
+            msg.kind = kind
+            msg._id = None
+            msg.prev_id = prev_id
+            return msg
+        return cls(data, receiver, sender, kind, prev_id)
+
+    @classmethod
+    def release(cls, msg):
+        """Returns a Message to the free list for reuse."""
+        if len(_MESSAGE_POOL) < _MAX_POOL_SIZE:
+            msg.data = msg.receiver = msg.sender = msg.prev_id = None
+            _MESSAGE_POOL.append(msg)
+
+    def __reduce__(self):
+        return _rebuild, (
+            self.data, self.receiver, self.sender, self.kind, self._id,
+            self.prev_id)
+
+    def __str__(self):
+        # Cheap short form; the full __repr__ formats every field and
+        # mints the id, so keep it for intentional repr() calls
+        return 'Message(kind=%s)' % (self.kind,)
+
+    def __repr__(self):
+        return 'Message(sender=%s, receiver=%s, kind=%s, data=%s) %s -> %s' % (
+            self.sender, self.receiver, self.kind,
+            self.data, self.prev_id, self.id)
+
+
+def _rebuild(data, receiver, sender, kind, _id, prev_id):
+    """Rebuilds a pickled Message with direct slot stores, no __init__."""
+    cdef Message msg = Message.__new__(Message)
+    msg.data = data
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = kind
+    msg._id = _id
+    msg.prev_id = prev_id
+    return msg
@@ -1,12 +1,35 @@
 import itertools
-import uuid
+import operator
+import threading
 from abc import ABC, abstractmethod
-from multiprocessing import Process, Queue
+from collections import deque
+from multiprocessing import Process, SimpleQueue, connection
 from typing import (
-    Any, Hashable, MutableMapping, MutableSequence, NoReturn, Optional
+    Any, Hashable, MutableMapping, MutableSequence, NoReturn, Optional,
+    Sequence
 )
 
-from ..messages import Message, MessageKind
+from ..channels import DequeChannel, PipeChannel
+from ..messages import MESSAGE_KIND_COUNT, Message, MessageKind, make_return
+
+_receiver = operator.attrgetter('receiver')
+
+# Hoisted enum members: IntEnum comparisons are plain int equality, and a
+# module-level binding skips two attribute loads per check in hot loops
+_BATCH = MessageKind.BATCH
+
+# Default actor names only need to be distinct within the system that
+# builds them (the parent process), so a counter beats reading urandom
+# through uuid4 for every actor constructed.
+_name_counter = itertools.count().__next__
+
+
+class _DrainStop:
+    """Marker telling an inbox-drain thread to exit (see _serve).
+
+    The class itself is the sentinel so identity survives channels that
+    pickle on put.
+    """
 
 
 class BaseActor(ABC):
@@ -15,22 +38,28 @@ class BaseActor(ABC):
     Attributes:
         name: A hashable otherwise that identifies the actor.
         inbox: A buffer that stores messages received from other actors.
+            Defaults to a multi-producer SimpleQueue, which writes to the
+            underlying pipe directly instead of through a feeder thread;
+            point-to-point topologies can pass a lighter channel, such as
+            channels.SpscRing.
         outbox: A mapping from actor names to their inboxes.
     """
-    __slots__ = ('name', 'inbox', 'outbox')
+    __slots__ = ('name', 'inbox', 'outbox', '_pending', '_puts', '_ready')
 
     def __init__(
             self,
             name: Optional[Hashable] = None,
             inbox: Optional[Any] = None):
         super().__init__()
-        self.name = self._else(name, str(uuid.uuid4().time_low))
-        self.inbox = self._else(inbox, Queue())
+        # Inline `is None` checks: a pointer compare in the caller's
+        # frame, with no helper call and no default evaluated unless the
+        # argument is actually missing
+        self.name = f'actor-{_name_counter()}' if name is None else name
+        self.inbox = SimpleQueue() if inbox is None else inbox
         self.outbox = {}
-
-    @staticmethod
-    def _else(optional, otherwise):
-        return optional if optional is not None else otherwise
+        self._pending = deque()
+        self._puts = {}
+        self._ready = None
 
     @abstractmethod
     def on_next(self, msg: Any) -> NoReturn:
@@ -54,18 +83,86 @@ class BaseActor(ABC):
         pass
 
     def receive(self) -> Any:
-        """Receives a message from another actor."""
-        return self.inbox.get(block=True)
+        """Receives a message from another actor.
+
+        Batched puts arrive as a list (or a BATCH message); extra messages
+        are parked in a local deque and drained before blocking again.
+        When a drain thread is serving the inbox (see _serve), this only
+        waits on the deque and never touches the channel itself.
+        """
+        pending = self._pending
+        ready = self._ready
+        while True:
+            msg = self._pop_pending()
+            if msg is not None:
+                return msg
+            if ready is None:
+                pending.append(self.inbox.get())
+            else:
+                ready.wait()
+                ready.clear()
+
+    def _pop_pending(self) -> Optional[Any]:
+        """Pops the next pending message, unwrapping batches."""
+        pending = self._pending
+        while pending:
+            item = pending.popleft()
+            if isinstance(item, list):
+                pending.extendleft(reversed(item))
+            elif getattr(item, 'kind', None) == _BATCH:
+                pending.extendleft(reversed(item.data))
+            else:
+                return item
+        return None
+
+    def _serve(self) -> Any:
+        """Runs the actor with a dedicated inbox-drain thread.
+
+        The thread blocks on the inbox and feeds the local pending deque,
+        so the handler never contends on the channel and starts on a
+        message as soon as it lands. Intended as the Process target for
+        actors managed by a system.
+        """
+        append = self._pending.append
+        ready = self._ready = threading.Event()
+        get = self.inbox.get
+
+        def drain():
+            while True:
+                item = get()
+                if item is _DrainStop:
+                    break
+                append(item)
+                ready.set()
+
+        thread = threading.Thread(target=drain, daemon=True)
+        thread.start()
+        try:
+            return self.run()
+        finally:
+            # Unblock the getter and reap the thread, or every
+            # thread-backed actor would leak its drain thread (and the
+            # channel it pins) into the calling process
+            self.inbox.put(_DrainStop)
+            thread.join()
 
     def connect(self, *actors: 'BaseActor') -> NoReturn:
-        """Enables this actor to send messages to other actors."""
+        """Enables this actor to send messages to other actors.
+
+        The bound put of each inbox is cached alongside it, so send
+        resolves a receiver with one dict get instead of an attribute
+        lookup per message.
+        """
         self.outbox.update((a.name, a.inbox) for a in actors)
+        self._puts.update((a.name, a.inbox.put) for a in actors)
 
     def disconnect(self, *actors: 'BaseActor') -> NoReturn:
         """Disables this actor from sending messages to other actors."""
         pop = self.outbox.pop
+        pop_put = self._puts.pop
         for a in actors:
             pop(a.name, None)
+            pop_put(a.name, None)
 
     def __repr__(self):
         return f'{self.__class__.__name__}(name={self.name})'
@@ -81,11 +178,32 @@ class MessageActor(BaseActor):
     _EMPTY_ARGS = ()
     _EMPTY_KWARGS = {}
 
-    __slots__ = ('attrs',)
+    __slots__ = ('attrs', '_dispatch')
 
-    def __init__(self, name: Optional[Hashable] = None):
-        super().__init__(name)
+    def __init__(
+            self,
+            name: Optional[Hashable] = None,
+            inbox: Optional[Any] = None):
+        super().__init__(name, inbox)
         self.attrs: MutableMapping[Hashable, Any] = {}
+        # MessageKind is an IntEnum, so a flat table indexed by kind gives
+        # O(1) dispatch with a plain subscript per message; freezing it
+        # into a tuple makes the subscript a fixed-array load
+        self._dispatch: Sequence[Any] = tuple(self._build_dispatch())
+
+    def _build_dispatch(self) -> MutableSequence[Any]:
+        """Returns the kind-indexed handler table as a mutable list.
+
+        Subclasses that handle extra kinds override this, extend the
+        result of super(), and hand it back before __init__ freezes it.
+        """
+        table = [None] * MESSAGE_KIND_COUNT
+        table[MessageKind.DEFAULT] = self.on_next
+        table[MessageKind.CALL] = self.handle_call
+        table[MessageKind.RETURN] = self.handle_return
+        table[MessageKind.ACK] = self.handle_ack
+        table[MessageKind.SET] = self.handle_set
+        return table
 
     def on_next(self, msg: Message) -> NoReturn:
         """Processes a message."""
@@ -96,21 +214,23 @@ class MessageActor(BaseActor):
         pass
 
     def run(self) -> NoReturn:
-        """Initiates the actor."""
-        while not self.should_stop():
-            msg = self.receive()
-            if self.should_ignore(msg):
-                pass
-            elif msg.kind == MessageKind.DEFAULT:
-                self.on_next(msg)
-            elif msg.kind == MessageKind.CALL:
-                self.handle_call(msg)
-            elif msg.kind == MessageKind.RETURN:
-                self.handle_return(msg)
-            elif msg.kind == MessageKind.ACK:
-                self.handle_ack(msg)
-            elif msg.kind == MessageKind.SET:
-                self.handle_set(msg)
+        """Initiates the actor.
+
+        Lookups are hoisted out of the loop and messages are dispatched
+        through a jump table indexed by MessageKind, so each message
+        costs one subscript instead of a chain of comparisons.
+        """
+        table = self._dispatch
+        stop = self.should_stop
+        receive = self.receive
+        ignore = self.should_ignore
+        while not stop():
+            msg = receive()
+            if ignore(msg):
+                continue
+            handler = table[msg.kind]
+            if handler is not None:
+                handler(msg)
 
     def handle_call(self, msg: Message) -> NoReturn:
         """Handle CALL Message."""
@@ -123,18 +243,26 @@ class MessageActor(BaseActor):
 
         # Send a message with returned otherwise if requested
         if msg.sender and data.get('return', True):
-            return_msg = Message(
-                return_data,
-                sender=self.name,
-                receiver=msg.sender,
-                kind=MessageKind.RETURN,
-                prev_id=msg.id)
-            self.send(return_msg)
+            self.send(make_return(return_data, msg.sender, self.name, msg.id))
 
     def send(self, *msgs: Any) -> NoReturn:
-        """Sends messages to other actors."""
-        for m in msgs:
-            self.outbox[m.receiver].put(m, block=True)
+        """Sends messages to other actors.
+
+        Consecutive messages to the same receiver are grouped into a
+        single put, so fan-outs pay one lock acquisition and one pickle
+        per receiver instead of one per message.
+        """
+        puts = self._puts
+        for receiver, group in itertools.groupby(msgs, key=_receiver):
+            if receiver is None:
+                # BroadcastMessages carry receiver None; expand each into
+                # per-receiver messages only here, at the channel boundary
+                for broadcast in group:
+                    for msg in broadcast.messages():
+                        puts[msg.receiver](msg)
+                continue
+            batch = list(group)
+            puts[receiver](batch if len(batch) > 1 else batch[0])
 
     def handle_return(self, msg: Message) -> NoReturn:
         """Handle RETURN Message."""
@@ -160,21 +288,29 @@ class BaseActorSystem(BaseActor, ABC):
     Attributes:
         actors: A sequence of actors that the system manages.
     """
-    __slots__ = ('actors', '_actors')
+    __slots__ = ('actors', '_actors', '_worker')
 
     def __init__(
             self,
             name: Optional[Hashable] = None,
-            inbox: Optional[Any] = None):
+            inbox: Optional[Any] = None,
+            threaded: bool = False):
         super().__init__(name, inbox)
         self.actors: MutableSequence[BaseActor] = []
         self._actors: MutableMapping[Hashable, Process] = {}
+        self._worker = threading.Thread if threaded else Process
+
+    def connect(self, *actors: 'BaseActor', complete: bool = False) -> NoReturn:
+        """Connects all actors to the system, and optionally to each other.
 
-    def connect(self, *actors: 'BaseActor', complete: bool = True) -> NoReturn:
-        """Fully connects all actors to each other and the system."""
+        The full peer-to-peer mesh costs O(N^2) connects and leaks every
+        actor's inbox handle into every worker, so it is opt-in via
+        complete=True; by default each actor can only reach the system.
+        """
         super().connect(*actors)
         self.actors.extend(actors)
-        self._actors.update((a.name, Process(target=a.run)) for a in actors)
+        self._actors.update(
+            (a.name, self._worker(target=a._serve)) for a in actors)
 
         for a in actors:
             a.connect(self)
@@ -189,9 +325,17 @@ class BaseActorSystem(BaseActor, ABC):
 
     def run(self) -> NoReturn:
         """Initiates all actor processes and waits for their termination."""
+        self._start()
+        super().run()
+        self._join()
+
+    def _start(self) -> NoReturn:
+        """Starts all actor workers."""
         for a in self._actors.values():
             a.start()
-        super().run()
+
+    def _join(self) -> NoReturn:
+        """Waits for all actor workers to terminate."""
         for a in self._actors.values():
             a.join()
 
@@ -207,26 +351,64 @@ class BaseActorSystem(BaseActor, ABC):
 class MessageActorSystem(MessageActor, ABC):
     """An actor system that runs as a MessageActor."""
 
-    __slots__ = ('actors', '_actors')
+    __slots__ = ('actors', '_actors', '_worker', '_returns')
 
     def __init__(
             self,
-            name: Optional[Hashable] = None):
-        super().__init__(name)
+            name: Optional[Hashable] = None,
+            threaded: bool = False):
+        super().__init__(name, DequeChannel() if threaded else None)
         self.actors: MutableSequence[BaseActor] = []
         self._actors: MutableMapping[Hashable, Process] = {}
-
-    def connect(self, *actors: 'MessageActor', complete: bool = True) -> NoReturn:
-        """Fully connects all actors to each other and the system."""
+        self._worker = threading.Thread if threaded else Process
+        self._returns: MutableSequence[Any] = []
+
+    def connect(self, *actors: 'MessageActor', complete: bool = False) -> NoReturn:
+        """Connects all actors to the system, and optionally to each other.
+
+        With process workers, each actor sends back to the system over
+        its own pipe, so the system can block once across all of them
+        instead of funnelling every worker through one queue. Thread
+        workers keep the system's reference-passing inbox instead: a
+        pipe would pickle every result (and hang on an unpicklable one)
+        for no isolation gain. See BaseActorSystem.connect for why the
+        full mesh is opt-in.
+        """
         super().connect(*actors)
         self.actors.extend(actors)
-        self._actors.update((a.name, Process(target=a.run)) for a in actors)
+        self._actors.update(
+            (a.name, self._worker(target=a._serve)) for a in actors)
 
+        threaded = self._worker is threading.Thread
         for a in actors:
             a.connect(self)
+            if threaded:
+                continue
+            channel = PipeChannel()
+            a.outbox[self.name] = channel
+            a._puts[self.name] = channel.put
+            self._returns.append(channel.reader)
         if complete:
             self._make_complete(*actors)
 
+    def receive(self) -> Any:
+        """Receives a message from any connected actor.
+
+        One multiplexed connection.wait covers every worker's return
+        pipe, costing a single syscall per wakeup regardless of how many
+        workers are connected.
+        """
+        returns = self._returns
+        if not returns:
+            return super().receive()
+        pending = self._pending
+        while True:
+            msg = self._pop_pending()
+            if msg is not None:
+                return msg
+            for conn in connection.wait(returns):
+                pending.append(conn.recv())
+
     @staticmethod
     def _make_complete(*actors: 'MessageActor') -> NoReturn:
         for a1, a2 in itertools.combinations(actors, r=2):
@@ -235,9 +417,17 @@ class MessageActorSystem(MessageActor, ABC):
 
     def run(self) -> NoReturn:
         """Initiates all actor processes and waits for their termination."""
+        self._start()
+        super().run()
+        self._join()
+
+    def _start(self) -> NoReturn:
+        """Starts all actor workers."""
         for a in self._actors.values():
             a.start()
-        super().run()
+
+    def _join(self) -> NoReturn:
+        """Waits for all actor workers to terminate."""
         for a in self._actors.values():
             a.join()
 
@@ -1,34 +1,166 @@
-from typing import Any, Callable, NoReturn, Sequence
+import ctypes
+import pickle
+import struct
+from multiprocessing import Value, get_start_method, shared_memory
+from typing import Any, Callable, NoReturn, Optional, Sequence
 
 from ..actors import MessageActor, MessageActorSystem
-from ..messages import Message, MessageKind
+from ..channels import DequeChannel, PipeChannel
+from ..messages import Message, MessageKind, make_return
+
+# Placeholder for results that have not been collected from a worker yet.
+_UNSET = object()
+
+# Hoisted enum member for the coordinator's drain loop (int comparison)
+_RETURN = MessageKind.RETURN
+
+# Below this many items, process startup and per-message pickling dwarf
+# the work for typical callables, so the auto backend picks threads.
+_THREAD_CUTOFF = 32
+
+
+class _Written:
+    """Marker returned when a result was written to shared memory."""
+
+
+class _Inherited:
+    """Marker for a function inherited through fork, not the message."""
+
+
+# Stashed by MapActorSystem.run just before the workers fork, so each
+# child finds the function in its own memory instead of unpickling it.
+_MAP_FUNC = None
+
+
+def _typecode(iterable: Sequence[Any]) -> Optional[str]:
+    """Returns the array typecode shared by all items, if any."""
+    kinds = {type(v) for v in iterable}
+    if kinds == {int}:
+        return 'q'
+    if kinds == {float}:
+        return 'd'
+    return None
 
 
 class ActorPool:
-    """Manages a fixed set of actors behind simple  interface"""
+    """Manages a fixed set of actors behind simple  interface
+
+    Attributes:
+        processes: The number of actors to run in parallel.
+        backend: One of 'auto', 'threads', or 'processes'. Threads skip
+            fork and pickling costs and win for small or cheap workloads;
+            'auto' picks threads for short iterables.
+    """
 
-    __slots__ = ('processes',)
+    __slots__ = ('processes', 'backend')
 
-    def __init__(self, processes: int):
+    def __init__(self, processes: int, backend: str = 'auto'):
         self.processes = processes
+        self.backend = backend
 
     def map(self, func: Callable, iterable: Sequence[Any]):
         num_actors = min(len(iterable), self.processes)
-        actors = (MapActor() for _ in range(num_actors))
-        system = MapActorSystem(func, iterable)
+        threaded = self._use_threads(iterable)
+        # Exactly one producer (the system) feeds each worker, so a raw
+        # pipe (processes) or a GIL-atomic deque (threads) replaces the
+        # default locked, multi-producer queue
+        inboxes = (DequeChannel() if threaded else PipeChannel()
+                   for _ in range(num_actors))
+        actors = (MapActor(inbox=i) for i in inboxes)
+        system = MapActorSystem(func, iterable, threaded=threaded)
         system.connect(*actors)
         return system.run()
 
+    def _use_threads(self, iterable: Sequence[Any]) -> bool:
+        if self.backend == 'auto':
+            return len(iterable) <= _THREAD_CUTOFF
+        return self.backend == 'threads'
+
 
 class MapActor(MessageActor):
     """An actor specially designed to work for ActorPool.map"""
 
-    def __init__(self):
-        super().__init__()
-        self.attrs['_stop'] = False
+    __slots__ = ('_stop', '_shm', '_results')
+
+    def __init__(self, inbox: Optional[Any] = None):
+        super().__init__(inbox=inbox)
+        # Single writer (this actor's own process), so no lock is needed;
+        # should_stop becomes a single C load instead of a dict lookup.
+        self._stop = Value(ctypes.c_bool, False, lock=False)
+        self._shm = None
+        self._results = None
+
+    def _build_dispatch(self):
+        table = super()._build_dispatch()
+        table[MessageKind.CALL_INIT] = self.handle_call_init
+        return table
+
+    def handle_call_init(self, msg: Message) -> NoReturn:
+        """Handle CALL_INIT Message: bind the function, then call it."""
+        func = msg.data['func']
+        if func is _Inherited:
+            func = _MAP_FUNC
+        elif isinstance(func, bytes):
+            func = pickle.loads(func)
+        self.attrs[msg.data['name']] = func
+        self.handle_call(msg)
 
     def should_stop(self) -> bool:
-        return self.attrs['_stop']
+        return self._stop.value
+
+    def handle_call(self, msg: Message) -> NoReturn:
+        """Handle CALL Message over a chunk of the mapped input.
+
+        The whole chunk is iterated in-process, so the coordinator is
+        involved once per worker rather than once per item. When the call
+        carries a result-buffer reference, results are stored directly
+        into the caller's slots and only a marker travels back, so the
+        RETURN message never pickles the values.
+        """
+        data = msg.data
+        chunk = data.get('chunk')
+        if chunk is None:
+            super().handle_call(msg)
+            return
+
+        method = self.attrs[data['name']]
+        return_data = [method(v) for v in chunk]
+
+        slot = data.get('shm')
+        if slot is not None:
+            name, typecode, start = slot
+            try:
+                view = self._view(name, typecode)
+                for i, v in enumerate(return_data):
+                    view[start + i] = v
+                return_data = _Written
+            except (TypeError, ValueError, OverflowError):
+                # Results do not fit the slots; ship them back in the
+                # message and let the coordinator overwrite the chunk
+                pass
+
+        if msg.sender and data.get('return', True):
+            self.send(make_return(return_data, msg.sender, self.name, msg.id))
+
+    def _view(self, name: str, typecode: str) -> memoryview:
+        if self._results is None:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._results = memoryview(self._shm.buf).cast(typecode)
+        return self._results
+
+    def _release(self) -> NoReturn:
+        if self._results is not None:
+            self._results.release()
+            self._shm.close()
+            self._results = self._shm = None
+
+    def handle_set(self, msg: Message) -> NoReturn:
+        data = msg.data
+        if data['name'] == '_stop':
+            self._release()
+            self._stop.value = data['value']
+        else:
+            super().handle_set(msg)
 
     def on_next(self, msg: Message) -> NoReturn:
         # Function calls are handled by run
@@ -38,70 +170,142 @@ class MapActor(MessageActor):
 class MapActorSystem(MessageActorSystem):
     """An MessageActorSystem specially designed to work for ActorPool.map"""
 
-    __slots__ = ('func', 'iterable', 'remaining_items', 'result_map', 'result')
+    __slots__ = (
+        'func', 'iterable', 'remaining_items', 'result', '_outstanding',
+        '_worker_idx', '_typecode', '_shm', '_threaded')
 
-    def __init__(self, func: Callable, iterable: Sequence[Any]):
-        super().__init__()
+    def __init__(
+            self,
+            func: Callable,
+            iterable: Sequence[Any],
+            threaded: bool = False):
+        super().__init__(threaded=threaded)
         self.func = func
-        self.iterable = iter(enumerate(iterable))
+        self._threaded = threaded
+        self.iterable = iterable
 
         self.remaining_items = len(iterable)
-        self.result_map = {}
-        self.result = [None] * self.remaining_items
 
-    def connect(self, *actors: 'MessageActor') -> NoReturn:
-        super().connect(*actors, complete=False)
+        # Each worker has exactly one outstanding chunk, so a flat table
+        # indexed by worker replaces a dict keyed on message ids — no
+        # insert/delete churn per completion (filled in by run)
+        self._outstanding = []
+        self._worker_idx = {}
+
+        # Homogeneous numeric inputs get a preallocated shared-memory
+        # result buffer that workers write into directly; anything else
+        # falls back to collecting values from RETURN messages.
+        self._typecode = _typecode(iterable) if len(iterable) else None
+        if self._typecode is not None:
+            size = len(iterable) * struct.calcsize(self._typecode)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self.result = [_UNSET] * self.remaining_items
+        else:
+            self._shm = None
+            self.result = [None] * self.remaining_items
 
     def run(self) -> Any:
-        # Prepare each actor
-        for actor in self.outbox:
-            # Make function available to actor
-            msg1 = Message(
-                {'name': '_func', 'value': self.func},
-                receiver=actor,
-                kind=MessageKind.SET)
-
-            # Send first value to each actor
-            idx, value = next(self.iterable)
-            msg2 = Message(
-                {'name': '_func', 'args': [value]},
-                sender=self.name,
-                receiver=actor,
-                kind=MessageKind.CALL)
-            self.send(msg1, msg2)
+        # Thread-backed inboxes pass references, so workers can take the
+        # function object itself. With the fork start method the function
+        # is stashed in a module global that the children inherit for
+        # free; only the spawn fallback still pickles it (once).
+        global _MAP_FUNC
+        if self._threaded:
+            func = self.func
+        elif get_start_method() == 'fork':
+            _MAP_FUNC = self.func
+            func = _Inherited
+        else:
+            func = pickle.dumps(self.func)
+
+        # The workers must be running before the chunks are written:
+        # pipes are bounded, and a chunk bigger than the OS buffer would
+        # block send forever with no reader alive on the other end
+        self._start()
+
+        # Hand each actor one contiguous chunk of the input in a single
+        # CALL_INIT, so message count scales with the number of workers
+        # rather than the number of items
+        items = self.iterable
+        workers = list(self.outbox)
+        size, extra = divmod(len(items), len(workers)) if workers else (0, 0)
+        self._outstanding = [None] * len(workers)
+        self._worker_idx = {a: i for i, a in enumerate(workers)}
+        start = 0
+        for i, actor in enumerate(workers):
+            length = size + (1 if i < extra else 0)
+            data = self._call_data(start, items[start:start + length])
+            data['func'] = func
+            msg = Message(data, actor, self.name, MessageKind.CALL_INIT)
+            self.send(msg)
 
             # Save state
-            self.result_map[msg2.id] = idx
+            self._outstanding[i] = (start, length)
+            start += length
+
+        # Collect until every chunk is accounted for, then reap
+        MessageActor.run(self)
+        self._join()
 
-        # Start actors
-        super().run()
+        _MAP_FUNC = None
+        return self._collate()
 
-        return self.result
+    def _call_data(self, start: int, chunk: Sequence[Any]) -> dict:
+        data = {'name': '_func', 'chunk': chunk}
+        if self._shm is not None:
+            data['shm'] = (self._shm.name, self._typecode, start)
+        return data
+
+    def _collate(self) -> Sequence[Any]:
+        """Merges shared-memory slots with message-borne results."""
+        if self._shm is None:
+            return self.result
+        view = memoryview(self._shm.buf).cast(self._typecode)
+        result = [
+            view[i] if r is _UNSET else r
+            for i, r in enumerate(self.result)]
+        view.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        return result
 
     def handle_return(self, msg: Message) -> NoReturn:
-        # Place value in result and update state
-        id = msg.prev_id
-        value_idx = self.result_map[id]
-        del self.result_map[id]
-        self.result[value_idx] = msg.data
-        self.remaining_items -= 1
-
-        try:
-            # Assign more work if available
-            idx, value = next(self.iterable)
-            msg = Message(
-                {'name': '_func', 'args': [value]},
-                sender=self.name,
-                receiver=msg.sender,
-                kind=MessageKind.CALL)
-            self.result_map[msg.id] = idx
-        except StopIteration:
-            # Tell actor to stop
-            msg = Message(
-                {'name': '_stop', 'value': True},
-                receiver=msg.sender,
-                kind=MessageKind.SET)
-        self.send(msg)
+        """Collates a worker's sub-results and releases the worker.
+
+        This is the coordinator's hot path, so state is hoisted into
+        locals once and any RETURNs already sitting in the pending deque
+        are drained in the same tight loop rather than paying a full
+        dispatch round trip per message.
+        """
+        pending = self._pending
+        result = self.result
+        outstanding = self._outstanding
+        worker_idx = self._worker_idx
+        send = self.send
+        recycle = not self._threaded
+        while True:
+            # Place the worker's chunk in result and update state
+            start, length = outstanding[worker_idx[msg.sender]]
+            if msg.data is not _Written:
+                result[start:start + length] = msg.data
+            self.remaining_items -= length
+
+            # Each worker owns exactly one chunk, so it is done now. The
+            # stop message comes from the free list, and pipes serialize
+            # on put, so it can go straight back (threads pass references
+            # and must not recycle)
+            out = Message.acquire(
+                {'name': '_stop', 'value': True}, msg.sender, None,
+                MessageKind.SET)
+            send(out)
+            if recycle:
+                Message.release(out)
+
+            if pending and getattr(pending[0], 'kind', None) == _RETURN:
+                msg = pending.popleft()
+            else:
+                break
 
     def should_stop(self) -> bool:
         return self.remaining_items == 0
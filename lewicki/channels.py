@@ -0,0 +1,215 @@
+import pickle
+import struct
+import threading
+import time
+from collections import deque
+from multiprocessing import Pipe, shared_memory
+from typing import Any
+
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = 64
+_SLOTS_OFFSET = 128
+_COUNTER = struct.Struct('<Q')
+_LENGTH = struct.Struct('<I')
+
+
+class SpscRing:
+    """A bounded single-producer/single-consumer ring buffer.
+
+    The ring lives in a shared-memory segment so that exactly one producer
+    process and one consumer process can exchange messages without a lock,
+    a feeder thread, or a syscall per message. The segment holds a
+    power-of-two array of fixed-size slots plus ``head``/``tail`` counters
+    padded to separate cache lines. The producer only writes ``head`` and
+    the consumer only writes ``tail``, so plain ordered stores suffice.
+
+    Messages are pickled into a slot; payloads larger than a slot spill
+    into a one-off shared-memory blob whose name is passed through the
+    ring instead.
+
+    Unlike the default ``multiprocessing.Queue`` inbox, a ring is only
+    valid for a single producer/consumer pair, so it is an opt-in inbox
+    for point-to-point topologies rather than the shared default.
+
+    Attributes:
+        name: The name of the backing shared-memory segment.
+        capacity: The number of message slots (a power of two).
+        slot_size: The number of payload bytes per slot.
+    """
+
+    __slots__ = ('name', 'capacity', 'slot_size', '_shm', '_buf', '_mask')
+
+    def __init__(self, capacity: int = 1024, slot_size: int = 1024):
+        if capacity & (capacity - 1):
+            raise ValueError('capacity must be a power of two')
+        self.capacity = capacity
+        self.slot_size = slot_size
+        size = _SLOTS_OFFSET + capacity * (slot_size + _LENGTH.size)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        self._mask = capacity - 1
+
+    @classmethod
+    def _attach(cls, name: str, capacity: int, slot_size: int) -> 'SpscRing':
+        ring = object.__new__(cls)
+        ring.name = name
+        ring.capacity = capacity
+        ring.slot_size = slot_size
+        ring._shm = shared_memory.SharedMemory(name=name)
+        ring._buf = ring._shm.buf
+        ring._mask = capacity - 1
+        return ring
+
+    def __reduce__(self):
+        return type(self)._attach, (self.name, self.capacity, self.slot_size)
+
+    def _slot(self, index: int) -> int:
+        return _SLOTS_OFFSET + (index & self._mask) * (self.slot_size
+                                                       + _LENGTH.size)
+
+    def put(self, item: Any, block: bool = True) -> None:
+        """Appends an item, spinning while the ring is full."""
+        buf = self._buf
+        payload = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.slot_size:
+            payload = self._spill(payload)
+        head, = _COUNTER.unpack_from(buf, _HEAD_OFFSET)
+        while head - _COUNTER.unpack_from(buf, _TAIL_OFFSET)[0] \
+                == self.capacity:
+            if not block:
+                raise BlockingIOError('ring is full')
+            time.sleep(0)
+        offset = self._slot(head)
+        _LENGTH.pack_into(buf, offset, len(payload))
+        buf[offset + _LENGTH.size:offset + _LENGTH.size + len(payload)] = \
+            payload
+        # The payload write above must land before the head update below;
+        # CPython emits the stores in order and x86 keeps them ordered.
+        _COUNTER.pack_into(buf, _HEAD_OFFSET, head + 1)
+
+    def get(self, block: bool = True) -> Any:
+        """Removes and returns an item, spinning while the ring is empty."""
+        buf = self._buf
+        tail, = _COUNTER.unpack_from(buf, _TAIL_OFFSET)
+        while _COUNTER.unpack_from(buf, _HEAD_OFFSET)[0] == tail:
+            if not block:
+                raise BlockingIOError('ring is empty')
+            time.sleep(0)
+        offset = self._slot(tail)
+        length, = _LENGTH.unpack_from(buf, offset)
+        payload = bytes(
+            buf[offset + _LENGTH.size:offset + _LENGTH.size + length])
+        _COUNTER.pack_into(buf, _TAIL_OFFSET, tail + 1)
+        item = pickle.loads(payload)
+        if isinstance(item, _Spilled):
+            item = item.load()
+        return item
+
+    @staticmethod
+    def _spill(payload: bytes) -> bytes:
+        blob = shared_memory.SharedMemory(create=True, size=len(payload))
+        blob.buf[:len(payload)] = payload
+        spilled = _Spilled(blob.name, len(payload))
+        blob.close()
+        return pickle.dumps(spilled, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        """Releases this process's view of the ring."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the backing shared-memory segment."""
+        self._shm.unlink()
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(name={self.name}, '
+                f'capacity={self.capacity}, slot_size={self.slot_size})')
+
+
+class PipeChannel:
+    """A queue-like wrapper over a one-way multiprocessing Pipe.
+
+    A raw pipe has no lock and no feeder thread, so for exactly one
+    producer and one consumer it is strictly cheaper than a Queue: put
+    and get are a single os.write/os.read each. The reader connection is
+    exposed so a consumer can multiplex several channels with
+    multiprocessing.connection.wait.
+
+    Attributes:
+        reader: The receiving Connection end of the pipe.
+        writer: The sending Connection end of the pipe.
+    """
+
+    __slots__ = ('reader', 'writer')
+
+    def __init__(self):
+        self.reader, self.writer = Pipe(duplex=False)
+
+    def put(self, item: Any) -> None:
+        """Sends an item to the consumer."""
+        self.writer.send(item)
+
+    def get(self) -> Any:
+        """Receives an item, blocking until one is available."""
+        return self.reader.recv()
+
+    def close(self) -> None:
+        """Closes both ends of the pipe."""
+        self.reader.close()
+        self.writer.close()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+
+class DequeChannel:
+    """An unbounded lock-free channel for actors running as threads.
+
+    CPython's GIL already makes deque.append and deque.popleft atomic,
+    so a single consumer needs no lock at all — an Event only provides
+    the blocking wakeup. Unlike queue.SimpleQueue there is no lock to
+    acquire per operation and items are passed by reference.
+    """
+
+    __slots__ = ('_items', '_ready')
+
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put(self, item: Any) -> None:
+        """Appends an item and wakes the consumer."""
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self) -> Any:
+        """Removes and returns an item, blocking until one is available."""
+        items = self._items
+        ready = self._ready
+        while not items:
+            ready.wait()
+            ready.clear()
+        return items.popleft()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(size={len(self._items)})'
+
+
+class _Spilled:
+    """A reference to an oversize payload parked in its own segment."""
+
+    __slots__ = ('name', 'size')
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def load(self) -> Any:
+        blob = shared_memory.SharedMemory(name=self.name)
+        try:
+            return pickle.loads(bytes(blob.buf[:self.size]))
+        finally:
+            blob.close()
+            blob.unlink()
@@ -1,9 +1,31 @@
-import uuid
-from enum import Enum
-from typing import Any, Hashable, Optional
+from __future__ import annotations
 
+import itertools
+import os
+from enum import IntEnum
+from typing import Any, ClassVar, Hashable
 
-class MessageKind(Enum):
+# Message ids only need to be unique, not random: a counter laid over a
+# pid-derived base avoids reading 16 bytes of urandom per message the way
+# uuid4 does, and makes each id a single int rather than a tuple. One
+# urandom read per process seeds the low bits so ids are not guessably
+# sequential, while uniqueness still comes from the pid and the counter.
+# Forked children inherit the counter state, so the base is rebuilt from
+# the child's pid (and a fresh seed) to keep ids distinct across actor
+# processes.
+_id_counter = itertools.count().__next__
+
+
+def _refresh_id_base() -> None:
+    global _ID_BASE
+    _ID_BASE = (os.getpid() << 32) | int.from_bytes(os.urandom(4), 'little')
+
+
+_refresh_id_base()
+os.register_at_fork(after_in_child=_refresh_id_base)
+
+
+class MessageKind(IntEnum):
     """Specifies the kind of message sent to an Actor
 
     DEFAULT: Message contains arbitrary data
@@ -14,37 +36,286 @@ class MessageKind(Enum):
     ACK: Message contains no data, acknowledges receipt of previous message
     SET: Message contains variable name and value as a dict
         {'name': <variable_name>, 'value': <value>}
+    BATCH: Message contains a sequence of messages to deliver in order
+    CALL_INIT: Message contains a function to bind plus the arguments of
+        the first call, as a dict {'name': <attr_name>, 'func':
+        <function_or_pickled_bytes>, ['args': <args>]}
     """
     DEFAULT = 0
     CALL = 1
     RETURN = 2
     ACK = 3
     SET = 4
+    BATCH = 5
+    CALL_INIT = 6
+
+
+# Size for kind-indexed jump tables (MessageKind values are contiguous
+# from zero, so len doubles as one-past-the-highest value).
+MESSAGE_KIND_COUNT = len(MessageKind)
+
+# The default kind as a plain int: 0 is an interned small-int singleton,
+# so binding it skips the Enum member and makes downstream comparisons a
+# pointer check. IntEnum values compare and index identically either way.
+_DEFAULT_KIND = int(MessageKind.DEFAULT)
+
+# Free list of recycled Message instances, capped so a burst of traffic
+# cannot pin an unbounded number of dead messages in memory.
+_MESSAGE_POOL: list = []
+_MAX_POOL_SIZE = 1024
 
 
 class Message:
-    __slots__ = ('id', 'prev_id', 'sender', 'receiver', 'kind', 'data')
+    """A unit of communication between actors.
+
+    The class is kept friendly to PyPy's map-based instance layout as
+    well as CPython: a plain __slots__ tuple, no metaclass or decorator
+    tricks, and every construction path (``__init__``, ``acquire``, the
+    per-kind factories, ``_rebuild`` on unpickle) assigns the attributes
+    in the same order, so the JIT sees one stable shape.
+
+    __slots__ keeps each instance to six pointers plus the object
+    header — no per-instance __dict__ or __weakref__ — which matters
+    when millions of messages are alive at once.
+    """
+
+    __slots__ = ('_id', 'prev_id', 'sender', 'receiver', 'kind', 'data')
+
+    # Bound once: repr/str skip the self.__class__.__name__ descriptor
+    # walk, and subclasses that care can rebind it.
+    _CLS_NAME: ClassVar[str] = 'Message'
 
     def __init__(
             self,
             data: Any,
-            *,
             receiver: Hashable,
-            sender: Optional[Hashable] = None,
-            kind: Optional[Hashable] = MessageKind.DEFAULT,
-            prev_id: Optional[Hashable] = None):
+            sender: Hashable | None = None,
+            kind: Hashable | None = _DEFAULT_KIND,
+            prev_id: Hashable | None = None):
         self.data = data
         self.receiver = receiver
         self.sender = sender
         self.kind = kind
-        self.id = str(uuid.uuid4().time_low)
+        self._id = None
         self.prev_id = prev_id
 
+    @property
+    def id(self) -> int:
+        """The message's unique id, minted on first access.
+
+        Most messages are fire-and-forget and never correlated, so the
+        id is only paid for when something actually reads it.
+        """
+        id = self._id
+        if id is None:
+            # XOR only perturbs the seeded low 32 bits, so ids stay
+            # unique per process for the first 2**32 messages
+            id = self._id = _ID_BASE ^ _id_counter()
+        return id
+
+    @property
+    def route(self) -> tuple:
+        """A hashable (sender, receiver, kind) key for route caching.
+
+        Dispatchers that memoize per-route state can key on this tuple
+        directly instead of assembling one at every lookup.
+        """
+        return (self.sender, self.receiver, self.kind)
+
+    @classmethod
+    def acquire(
+            cls,
+            data: Any,
+            receiver: Hashable,
+            sender: Hashable | None = None,
+            kind: Hashable | None = _DEFAULT_KIND,
+            prev_id: Hashable | None = None) -> Message:
+        """Returns a recycled Message from the free list, or a new one."""
+        pool = _MESSAGE_POOL
+        if pool:
+            msg = pool.pop()
+            msg.data = data
+            msg.receiver = receiver
+            msg.sender = sender
+            msg.kind = kind
+            msg._id = None
+            msg.prev_id = prev_id
+            return msg
+        return cls(data, receiver, sender, kind, prev_id)
+
+    @classmethod
+    def release(cls, msg: Message) -> None:
+        """Returns a Message to the free list for reuse.
+
+        Only release a message once no consumer can still observe it —
+        after a transport that serializes on put (a pipe or queue), but
+        never after a reference-passing channel between threads. Field
+        references are cleared so payloads do not outlive the send.
+        """
+        if len(_MESSAGE_POOL) < _MAX_POOL_SIZE:
+            msg.data = msg.receiver = msg.sender = msg.prev_id = None
+            _MESSAGE_POOL.append(msg)
+
+    def __reduce__(self):
+        # One flat argument tuple and one _rebuild call per unpickle —
+        # no state dict and no separate __setstate__ round trip. The id
+        # travels as-is, so unminted ids stay lazy across the wire.
+        return _rebuild, (
+            self.data, self.receiver, self.sender, self.kind, self._id,
+            self.prev_id)
+
+    def __str__(self):
+        # Implicit stringification (print, tracebacks, log messages) only
+        # pays for the kind; the full form below formats every field and
+        # mints the id, so reserve it for intentional %r / repr() calls —
+        # ideally behind a logger.isEnabledFor guard.
+        return '%s(kind=%s)' % (self._CLS_NAME, self.kind)
+
+    def __repr__(self):
+        # One % interpolation instead of six intermediate f-strings
+        return '%s(sender=%s, receiver=%s, kind=%s, data=%s) %s -> %s' % (
+            self._CLS_NAME, self.sender, self.receiver, self.kind,
+            self.data, self.prev_id, self.id)
+
+
+def _rebuild(data, receiver, sender, kind, _id, prev_id):
+    """Rebuilds a pickled Message with direct slot stores, no __init__."""
+    msg = Message.__new__(Message)
+    msg.data = data
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = kind
+    msg._id = _id
+    msg.prev_id = prev_id
+    return msg
+
+
+try:
+    # Compiled from _speedups.pyx when setup.py runs with
+    # LEWICKI_ENABLE_SPEEDUPS; behaviourally identical to the class above
+    from lewicki._speedups import Message  # noqa: F811
+except ImportError:
+    pass
+
+# Layout guard: a stray class attribute or dropped __slots__ line would
+# silently grow every instance by a dict and a weakref slot, several
+# times the footprint. Checked against whichever variant won the import.
+assert Message.__dictoffset__ == 0 and Message.__weakrefoffset__ == 0
+assert Message.__basicsize__ <= 88
+
+
+_CALL = MessageKind.CALL
+_RETURN = MessageKind.RETURN
+_ACK = MessageKind.ACK
+_SET = MessageKind.SET
+
+# Per-kind factories: Message.__new__ plus direct slot stores skip the
+# __init__ call frame and the default-argument binding, and the kind is
+# a preloaded module global instead of two attribute lookups. They bind
+# whichever Message class won the import above.
+
+
+def make_call(
+        data: Any,
+        receiver: Hashable,
+        sender: Hashable | None = None,
+        prev_id: Hashable | None = None) -> Message:
+    """Builds a CALL message without running __init__."""
+    msg = Message.__new__(Message)
+    msg.data = data
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = _CALL
+    msg._id = None
+    msg.prev_id = prev_id
+    return msg
+
+
+def make_return(
+        data: Any,
+        receiver: Hashable,
+        sender: Hashable | None = None,
+        prev_id: Hashable | None = None) -> Message:
+    """Builds a RETURN message without running __init__."""
+    msg = Message.__new__(Message)
+    msg.data = data
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = _RETURN
+    msg._id = None
+    msg.prev_id = prev_id
+    return msg
+
+
+def make_ack(
+        receiver: Hashable,
+        sender: Hashable | None = None,
+        prev_id: Hashable | None = None) -> Message:
+    """Builds a data-free ACK message without running __init__."""
+    msg = Message.__new__(Message)
+    msg.data = None
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = _ACK
+    msg._id = None
+    msg.prev_id = prev_id
+    return msg
+
+
+def make_set(
+        data: Any,
+        receiver: Hashable,
+        sender: Hashable | None = None) -> Message:
+    """Builds a SET message without running __init__."""
+    msg = Message.__new__(Message)
+    msg.data = data
+    msg.receiver = receiver
+    msg.sender = sender
+    msg.kind = _SET
+    msg._id = None
+    msg.prev_id = None
+    return msg
+
+
+class BroadcastMessage:
+    """One payload fanned out to many receivers, stored columns-first.
+
+    Broadcasting by building one Message per peer pays an allocation per
+    receiver up front; this keeps a single shared payload next to a flat
+    tuple of receivers, and per-receiver messages are only materialized
+    (from the free list) at the channel boundary by send.
+    """
+
+    __slots__ = ('data', 'receivers', 'sender', 'kind', 'prev_id')
+
+    # Lets receiver-keyed grouping (MessageActor.send) spot broadcasts
+    # without an isinstance check on the per-message hot path.
+    receiver = None
+
+    def __init__(
+            self,
+            data: Any,
+            receivers: Any,
+            sender: Hashable | None = None,
+            kind: Hashable | None = _DEFAULT_KIND,
+            prev_id: Hashable | None = None):
+        self.data = data
+        self.receivers = tuple(receivers)
+        self.sender = sender
+        self.kind = kind
+        self.prev_id = prev_id
+
+    def messages(self):
+        """Yields one Message per receiver, sharing the payload."""
+        data = self.data
+        sender = self.sender
+        kind = self.kind
+        prev_id = self.prev_id
+        acquire = Message.acquire
+        for receiver in self.receivers:
+            yield acquire(data, receiver, sender, kind, prev_id)
+
     def __repr__(self):
-        cls = f'{self.__class__.__name__}'
-        sender = f'sender={self.sender}'
-        receiver = f'receiver={self.receiver}'
-        kind = f'kind={self.kind}'
-        data = f'data={self.data}'
-        sequence = f'{self.prev_id} -> {self.id}'
-        return f'{cls}({sender}, {receiver}, {kind}, {data}) {sequence}'
+        return '%s(sender=%s, receivers=%s, kind=%s, data=%s)' % (
+            self.__class__.__name__, self.sender, self.receivers, self.kind,
+            self.data)
@@ -1,5 +1,14 @@
+import os
+
 from setuptools import setup
 
+# The compiled Message class is opt-in: building it requires Cython, and
+# the pure-Python class in lewicki.messages is the fallback either way.
+ext_modules = []
+if os.environ.get('LEWICKI_ENABLE_SPEEDUPS'):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['lewicki/_speedups.pyx'], language_level=3)
+
 setup(
     name='lewicki',
     version='0.1.0',
@@ -8,5 +17,6 @@ setup(
     license='MIT',
     author='',
     author_email='',
-    description='A framework actor-based computing'
+    description='A framework actor-based computing',
+    ext_modules=ext_modules
 )